@@ -3,14 +3,35 @@
 This module separates concerns so each piece can be tested and swapped independently.
 """
 
-import hashlib
+import gzip
+import importlib.util
 import json
+import mmap
 import os
+import queue
+import subprocess
 import tempfile
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from itertools import islice
 
-import requests
+import httpx
+import msgspec
+import numpy as np
+import orjson
+import xxhash
+
+# Whisper models expect 16 kHz mono input
+SAMPLE_RATE = 16000
+
+# Stage episode files on tmpfs where available so a ~200 MB MP3 never goes
+# through the container's overlay filesystem; None means the system default
+STAGING_DIR = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
 
 
 def log(message: str, severity: str = "INFO", **kwargs):
@@ -19,8 +40,7 @@ def log(message: str, severity: str = "INFO", **kwargs):
     print(json.dumps(entry, ensure_ascii=False), flush=True)
 
 
-@dataclass
-class PodcastEpisode:
+class PodcastEpisode(msgspec.Struct):
     title: str
     description: str
     guid: str
@@ -37,6 +57,102 @@ class TranscriptionResult:
     segments: list[dict]
 
 
+# ====================================================================
+# Audio decoding
+# ====================================================================
+
+
+def _ffmpeg_decode_command(source: str) -> list[str]:
+    """ffmpeg invocation decoding ``source`` to 16 kHz mono float32 PCM on stdout.
+
+    Resampling from the podcasts' 44.1/48 kHz goes through libsoxr, which is
+    cheaper than ffmpeg's default swresample filter at comparable quality.
+    """
+    return [
+        "ffmpeg",
+        "-nostdin",
+        "-loglevel",
+        "error",
+        "-i",
+        source,
+        "-ac",
+        "1",
+        "-af",
+        f"aresample={SAMPLE_RATE}:resampler=soxr:precision=20",
+        "-ar",
+        str(SAMPLE_RATE),
+        "-f",
+        "f32le",
+        "pipe:1",
+    ]
+
+
+def decode_audio(path: str) -> np.ndarray:
+    """Decode an audio file to 16 kHz mono float32 PCM with ffmpeg."""
+    proc = subprocess.run(_ffmpeg_decode_command(path), capture_output=True)
+    if proc.returncode != 0:
+        raise RuntimeError(
+            f"ffmpeg failed ({proc.returncode}): {proc.stderr.decode(errors='replace')}"
+        )
+    return np.frombuffer(proc.stdout, dtype=np.float32)
+
+
+def decode_audio_stream(chunks: Iterable[bytes]) -> np.ndarray:
+    """Decode an MP3 byte stream to 16 kHz mono float32 PCM with ffmpeg.
+
+    Chunks are fed to ffmpeg's stdin from a background thread while PCM is
+    read from stdout, so decoding overlaps with the download. stderr is
+    drained on a third thread so a flood of per-frame errors from a corrupt
+    file can't fill its pipe and stall ffmpeg.
+    """
+    proc = subprocess.Popen(
+        _ffmpeg_decode_command("pipe:0"),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    feed_error: list[Exception] = []
+
+    def feed():
+        try:
+            for chunk in chunks:
+                proc.stdin.write(chunk)
+        except Exception as e:  # surfaced on the calling thread below
+            feed_error.append(e)
+        finally:
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+            # If ffmpeg exited early the download is abandoned part-way;
+            # release its connection and range workers now, not at GC
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+
+    stderr_chunks: list[bytes] = []
+    feeder = threading.Thread(target=feed, daemon=True)
+    drainer = threading.Thread(
+        target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True
+    )
+    feeder.start()
+    drainer.start()
+    raw = proc.stdout.read()
+    feeder.join()
+    drainer.join()
+    proc.wait()
+    stderr = b"".join(stderr_chunks)
+
+    # A failed download explains an ffmpeg failure, not the other way round
+    if feed_error and not isinstance(feed_error[0], BrokenPipeError):
+        raise feed_error[0]
+    if proc.returncode != 0:
+        raise RuntimeError(
+            f"ffmpeg failed ({proc.returncode}): {stderr.decode(errors='replace')}"
+        )
+    return np.frombuffer(raw, dtype=np.float32)
+
+
 # ====================================================================
 # Transcriber
 # ====================================================================
@@ -44,35 +160,91 @@ class TranscriptionResult:
 
 class Transcriber(ABC):
     @abstractmethod
-    def transcribe(self, audio_path: str) -> TranscriptionResult: ...
+    def transcribe(self, audio: str | np.ndarray) -> TranscriptionResult: ...
+
+    def load_audio(self, chunks: Iterable[bytes], workdir: str) -> str | np.ndarray:
+        """Turn a downloaded byte stream into input for ``transcribe``.
+
+        The default spools it to a file in ``workdir`` and returns the path.
+        """
+        path = os.path.join(workdir, "episode.mp3")
+        with open(path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        return path
 
 
 class WhisperTranscriber(Transcriber):
-    """Production transcriber using faster-whisper on GPU."""
+    """Production transcriber using faster-whisper on GPU.
+
+    VAD-segmented speech chunks are decoded ``batch_size`` at a time through
+    faster-whisper's ``BatchedInferencePipeline``.
+    """
 
     def __init__(
         self,
-        model_size: str = "large-v3",
+        model_size: str = "large-v3-turbo",
         device: str = "cuda",
-        compute_type: str = "float16",
+        compute_type: str = "int8_float16",
+        num_workers: int = 1,
+        batch_size: int = 16,
     ):
-        from faster_whisper import WhisperModel
+        from faster_whisper import BatchedInferencePipeline, WhisperModel
 
         log(f"Loading Whisper model: {model_size} on {device} ({compute_type})")
-        self._model = WhisperModel(model_size, device=device, compute_type=compute_type)
+        # Decoding runs on the GPU, so leave CPU threads at the CTranslate2 default
+        self._model = WhisperModel(
+            model_size,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=0,
+            num_workers=num_workers,
+        )
+        self._batched = BatchedInferencePipeline(model=self._model)
+        self._batch_size = batch_size
+        self._gpu_lock = threading.Lock()
         log("Model loaded successfully")
 
-    def transcribe(self, audio_path: str) -> TranscriptionResult:
-        segments, info = self._model.transcribe(
-            audio_path, language="sv", beam_size=5, vad_filter=True
+        # Pay CUDA context / cuBLAS init on startup rather than in the first
+        # request. Goes through the bare model: VAD would skip pure silence.
+        segments, _ = self._model.transcribe(
+            np.zeros(SAMPLE_RATE, dtype=np.float32), language="sv", beam_size=1
         )
+        list(segments)  # segments are generated lazily
+        log("Model warmed up")
+
+    def load_audio(self, chunks: Iterable[bytes], workdir: str) -> np.ndarray:
+        return decode_audio_stream(chunks)
+
+    def transcribe(self, audio: str | np.ndarray) -> TranscriptionResult:
+        if isinstance(audio, str):
+            audio = decode_audio(audio)
         segments_list = []
         full_text_parts = []
-        for seg in segments:
-            segments_list.append(
-                {"start": seg.start, "end": seg.end, "text": seg.text.strip()}
+        # One job on the GPU at a time while other requests keep downloading.
+        # Held across the loop because segments are decoded lazily.
+        with self._gpu_lock:
+            # Greedy decoding: beam search runs the decoder serially per beam
+            # for a negligible quality gain on this content
+            segments, info = self._batched.transcribe(
+                audio,
+                language="sv",
+                beam_size=1,
+                batch_size=self._batch_size,
+                vad_filter=True,
+                # Half the default speech padding trims more of the music and
+                # silence around speech. The batched pipeline already splits
+                # at 160 ms pauses, so min_silence_duration_ms stays as is.
+                vad_parameters={
+                    "threshold": 0.5,
+                    "speech_pad_ms": 200,
+                    "min_silence_duration_ms": 160,
+                },
             )
-            full_text_parts.append(seg.text.strip())
+            for seg in segments:
+                text = seg.text.strip()
+                segments_list.append({"start": seg.start, "end": seg.end, "text": text})
+                full_text_parts.append(text)
 
         return TranscriptionResult(
             language=info.language,
@@ -83,6 +255,203 @@ class WhisperTranscriber(Transcriber):
         )
 
 
+def _speech_only(audio: np.ndarray):
+    """Cut non-speech out of ``audio`` with the Silero VAD bundled in faster-whisper.
+
+    Returns the concatenated speech samples and a ``SpeechTimestampsMap`` that
+    maps times in that audio back to the original timeline (None if there was
+    no speech at all).
+    """
+    from faster_whisper.vad import (
+        SpeechTimestampsMap,
+        VadOptions,
+        get_speech_timestamps,
+    )
+
+    chunks = get_speech_timestamps(
+        audio,
+        VadOptions(threshold=0.5, min_silence_duration_ms=500, speech_pad_ms=200),
+        sampling_rate=SAMPLE_RATE,
+    )
+    if not chunks:
+        return np.zeros(0, dtype=np.float32), None
+    speech = np.concatenate([audio[c["start"] : c["end"]] for c in chunks])
+    return speech, SpeechTimestampsMap(chunks, SAMPLE_RATE)
+
+
+def _attn_implementation() -> str:
+    """Flash Attention 2 when the flash-attn wheel is installed, else PyTorch SDPA."""
+    if importlib.util.find_spec("flash_attn") is not None:
+        return "flash_attention_2"
+    return "sdpa"
+
+
+class TransformersWhisperTranscriber(Transcriber):
+    """Production transcriber using a batched Hugging Face pipeline on GPU.
+
+    Audio is split into 30s windows which are decoded ``batch_size`` at a time
+    in fp16, so the GPU works on many windows per forward pass instead of one.
+
+    Concurrent ``transcribe`` calls are micro-batched: a single worker thread
+    collects up to ``MAX_BATCH`` episodes and runs them through the pipeline
+    together, so windows from different episodes share forward passes. It only
+    waits (at most ``MAX_WAIT_S`` after the first) while other requests are
+    still in ``load_audio`` (streaming ffmpeg decode) or running VAD in
+    ``transcribe``; an episode that is alone is transcribed right away.
+    """
+
+    # Cloud Tasks dispatches at most 3 episodes at once (the queue's
+    # max_concurrent_dispatches in terraform/main.tf), so no batch can be larger
+    MAX_BATCH = 3
+    MAX_WAIT_S = 0.5
+
+    def __init__(
+        self,
+        model_id: str = "openai/whisper-large-v3-turbo",
+        device: str = "cuda",
+        batch_size: int = 24,
+    ):
+        import torch
+        from transformers import pipeline
+
+        attn_implementation = _attn_implementation()
+        log(
+            f"Loading Whisper model: {model_id} on {device} "
+            f"(float16, {attn_implementation}, batch_size={batch_size})"
+        )
+        self._pipe = pipeline(
+            "automatic-speech-recognition",
+            model=model_id,
+            torch_dtype=torch.float16,
+            device=device,
+            model_kwargs={"attn_implementation": attn_implementation},
+        )
+        # Preallocate the decoder KV cache once and reuse it across generate()
+        # calls instead of growing a dynamic cache token by token (Whisper
+        # supports static caches from transformers 4.43). SDPA only: Whisper's
+        # flash_attention_2 path gets no mask without padding, so it would
+        # attend over the cache's unfilled slots and silently decode garbage
+        if attn_implementation == "sdpa":
+            self._pipe.model.generation_config.cache_implementation = "static"
+        self._batch_size = batch_size
+        log("Model loaded successfully")
+
+        # Pay CUDA context / cuBLAS init and kernel selection on startup
+        # rather than in the first request
+        with torch.inference_mode():
+            self._pipe(
+                {
+                    "raw": np.zeros(SAMPLE_RATE, dtype=np.float32),
+                    "sampling_rate": SAMPLE_RATE,
+                },
+                batch_size=1,
+                generate_kwargs={"language": "sv", "task": "transcribe"},
+            )
+        log("Model warmed up")
+
+        # The worker is the only thread that touches the GPU. ``_preparing``
+        # counts calls in load_audio or in transcribe before the hand-off; the
+        # hand-off decrements it and enqueues under ``_lock`` together, so the
+        # worker never gives up on an episode that has finished VAD
+        self._pending: queue.Queue[tuple[dict, Future]] = queue.Queue()
+        self._preparing = 0
+        self._lock = threading.Lock()
+        threading.Thread(target=self._run_batches, daemon=True).start()
+
+    def load_audio(self, chunks: Iterable[bytes], workdir: str) -> np.ndarray:
+        self._start_preparing()
+        try:
+            return decode_audio_stream(chunks)
+        finally:
+            with self._lock:
+                self._preparing -= 1
+
+    def transcribe(self, audio: str | np.ndarray) -> TranscriptionResult:
+        self._start_preparing()
+        future: Future | None = None
+        try:
+            if isinstance(audio, str):
+                audio = decode_audio(audio)
+            duration = len(audio) / SAMPLE_RATE
+            # Intros, jingles and pauses would otherwise cost full decoder passes
+            speech, timestamps = _speech_only(audio)
+            del audio
+            if len(speech):
+                future = Future()
+        finally:
+            with self._lock:
+                self._preparing -= 1
+                if future is not None:
+                    inputs = {"raw": speech, "sampling_rate": SAMPLE_RATE}
+                    self._pending.put((inputs, future))
+
+        segments_list = []
+        full_text = ""
+        if future is not None:
+            outputs = future.result()
+            full_text = outputs["text"].strip()
+
+            for chunk in outputs["chunks"]:
+                start, end = chunk["timestamp"]
+                # The final chunk can come back without an end timestamp
+                if end is None:
+                    end = start
+                segments_list.append(
+                    {
+                        "start": timestamps.get_original_time(start),
+                        "end": timestamps.get_original_time(end, is_end=True),
+                        "text": chunk["text"].strip(),
+                    }
+                )
+
+        return TranscriptionResult(
+            # Language is forced, so there is no detection probability to report
+            language="sv",
+            language_probability=1.0,
+            duration=duration,
+            full_text=full_text,
+            segments=segments_list,
+        )
+
+    def _start_preparing(self) -> None:
+        with self._lock:
+            self._preparing += 1
+
+    def _run_batches(self) -> None:
+        import torch
+
+        while True:
+            batch = [self._pending.get()]
+            deadline = time.monotonic() + self.MAX_WAIT_S
+            while len(batch) < self.MAX_BATCH:
+                with self._lock:
+                    if not self._preparing and self._pending.empty():
+                        break
+                try:
+                    batch.append(
+                        self._pending.get(timeout=max(0, deadline - time.monotonic()))
+                    )
+                except queue.Empty:
+                    break
+
+            try:
+                # No autograd bookkeeping (version counters, grad tracking)
+                with torch.inference_mode():
+                    outputs = self._pipe(
+                        [inputs for inputs, _ in batch],
+                        chunk_length_s=30,
+                        batch_size=self._batch_size,
+                        return_timestamps=True,
+                        generate_kwargs={"language": "sv", "task": "transcribe"},
+                    )
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+            else:
+                for (_, future), output in zip(batch, outputs):
+                    future.set_result(output)
+
+
 class FakeTranscriber(Transcriber):
     """Instant fake transcriber for local development and tests."""
 
@@ -103,6 +472,13 @@ class FakeTranscriber(Transcriber):
 
 
 class Storage(ABC):
+    @abstractmethod
+    def transcription_path(self, episode: PodcastEpisode) -> str:
+        """Where ``upload_transcription`` stores this episode's transcription."""
+
+    @abstractmethod
+    def exists(self, path: str) -> bool: ...
+
     @abstractmethod
     def upload_transcription(
         self, episode: PodcastEpisode, result: TranscriptionResult
@@ -114,15 +490,28 @@ class GCSStorage(Storage):
 
     def __init__(self, bucket_name: str):
         from google.cloud import storage
+        from google.cloud.storage.retry import DEFAULT_RETRY
 
+        # Built once at import in main.py, so this client and its HTTP session
+        # are shared by every request the process serves
         self._client = storage.Client()
         self._bucket = self._client.bucket(bucket_name)
+        # The upload runs after Cloud Tasks has been told the task succeeded,
+        # so a transient GCS error must not lose the transcription. Overwriting
+        # the whole object is idempotent, but the client only retries uploads
+        # carrying a generation precondition unless given a policy.
+        self._upload_retry = DEFAULT_RETRY.with_delay(initial=1.0, maximum=16.0)
+
+    def transcription_path(self, episode: PodcastEpisode) -> str:
+        return f"transcriptions/{episode.guid}.json"
+
+    def exists(self, path: str) -> bool:
+        return self._bucket.blob(path).exists()
 
     def upload_transcription(
         self, episode: PodcastEpisode, result: TranscriptionResult
     ) -> str:
-        safe_name = episode.guid
-        blob_path = f"transcriptions/{safe_name}.json"
+        blob_path = self.transcription_path(episode)
 
         data = {
             "episode": {
@@ -141,9 +530,13 @@ class GCSStorage(Storage):
         }
 
         blob = self._bucket.blob(blob_path)
+        # Transcript JSON is repetitive text and compresses 5–10×; GCS serves
+        # it decompressed to clients that don't send Accept-Encoding: gzip
+        blob.content_encoding = "gzip"
         blob.upload_from_string(
-            json.dumps(data, indent=2, ensure_ascii=False),
+            gzip.compress(orjson.dumps(data)),
             content_type="application/json",
+            retry=self._upload_retry,
         )
         log(
             f"Uploaded transcription to gs://{self._bucket.name}/{blob_path}",
@@ -160,11 +553,19 @@ class LocalStorage(Storage):
         self._output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
 
+    def transcription_path(self, episode: PodcastEpisode) -> str:
+        # Only a filesystem-safe name, not a security boundary: xxh3 is far
+        # cheaper than MD5 and collision-resistant enough for episode guids
+        safe_name = xxhash.xxh3_64_hexdigest(episode.guid.encode())
+        return os.path.join(self._output_dir, f"{safe_name}.json")
+
+    def exists(self, path: str) -> bool:
+        return os.path.exists(path)
+
     def upload_transcription(
         self, episode: PodcastEpisode, result: TranscriptionResult
     ) -> str:
-        safe_name = hashlib.md5(episode.guid.encode()).hexdigest()
-        path = os.path.join(self._output_dir, f"{safe_name}.json")
+        path = self.transcription_path(episode)
 
         data = {
             "episode": {
@@ -182,8 +583,8 @@ class LocalStorage(Storage):
             },
         }
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data))
         log(f"Wrote transcription to {path}", path=path, episode_guid=episode.guid)
         return path
 
@@ -197,14 +598,181 @@ class Downloader(ABC):
     @abstractmethod
     def download(self, url: str, dest_path: str) -> None: ...
 
+    def iter_download(self, url: str) -> Iterator[bytes]:
+        """Yield the body of ``url`` in chunks as it arrives.
+
+        The default downloads to a temporary file first and replays it.
+        """
+        with tempfile.TemporaryDirectory(dir=STAGING_DIR) as tmpdir:
+            path = os.path.join(tmpdir, "download")
+            self.download(url, path)
+            with open(path, "rb") as f:
+                yield from iter(lambda: f.read(1024 * 1024), b"")
+
 
 class HTTPDownloader(Downloader):
+    """Download over parallel byte-range requests, one stream as a fallback.
+
+    A single connection rarely saturates the link for long MP3s, so files
+    larger than ``RANGE_SIZE`` are fetched as ``CONNECTIONS`` concurrent range
+    requests over their own HTTP/1.1 pool, one TCP connection each. Servers
+    that ignore ``Range`` get a plain streamed GET.
+    """
+
+    # Episodes are 20–200 MB; large reads keep per-chunk Python overhead negligible
+    CHUNK_SIZE = 256 * 1024
+    RANGE_SIZE = 8 * 1024 * 1024
+    CONNECTIONS = 4
+
+    def __init__(self, transport: httpx.BaseTransport | None = None):
+        # Clients live for the process, so TLS sessions and connections are
+        # reused across episodes instead of re-handshaking per download.
+        # Plain streamed GETs may multiplex over HTTP/2...
+        self._client = httpx.Client(
+            http2=True,
+            timeout=300,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=16),
+            transport=transport,
+        )
+        # ...but range requests sharing one HTTP/2 connection would be back to
+        # a single connection's throughput, so they stay on HTTP/1.1
+        self._range_client = httpx.Client(
+            timeout=300,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=16),
+            transport=transport,
+        )
+
     def download(self, url: str, dest_path: str) -> None:
-        resp = requests.get(url, stream=True, timeout=300)
-        resp.raise_for_status()
-        with open(dest_path, "wb") as f:
-            for chunk in resp.iter_content(chunk_size=8192):
-                f.write(chunk)
+        probe = self._probe_ranges(url)
+        if probe is None:
+            with self._client.stream("GET", url) as resp:
+                resp.raise_for_status()
+                with open(dest_path, "wb") as f:
+                    for chunk in resp.iter_bytes(chunk_size=self.CHUNK_SIZE):
+                        f.write(chunk)
+            return
+
+        url, size = probe
+        with open(dest_path, "wb+") as f:
+            f.truncate(size)
+            with mmap.mmap(f.fileno(), size) as mm:
+
+                def fetch_into(byte_range: tuple[int, int]) -> None:
+                    # Written as it arrives, so memory stays at a few chunks
+                    # per connection rather than a whole range
+                    offset = byte_range[0]
+                    for chunk in self._stream_range(url, *byte_range):
+                        mm[offset : offset + len(chunk)] = chunk
+                        offset += len(chunk)
+
+                with ThreadPoolExecutor(max_workers=self.CONNECTIONS) as pool:
+                    # list() re-raises the first failed range
+                    list(pool.map(fetch_into, _byte_ranges(size, self.RANGE_SIZE)))
+
+    def iter_download(self, url: str) -> Iterator[bytes]:
+        probe = self._probe_ranges(url)
+        if probe is None:
+            with self._client.stream("GET", url) as resp:
+                resp.raise_for_status()
+                yield from resp.iter_bytes(chunk_size=self.CHUNK_SIZE)
+            return
+
+        # Ranges are fetched up to CONNECTIONS ahead but yielded in order, so
+        # the consumer still sees one contiguous stream
+        url, size = probe
+        ranges = iter(_byte_ranges(size, self.RANGE_SIZE))
+        with ThreadPoolExecutor(max_workers=self.CONNECTIONS) as pool:
+            in_flight = deque(
+                pool.submit(self._fetch_range, url, *byte_range)
+                for byte_range in islice(ranges, self.CONNECTIONS)
+            )
+            try:
+                while in_flight:
+                    data = in_flight.popleft().result()
+                    next_range = next(ranges, None)
+                    if next_range is not None:
+                        in_flight.append(
+                            pool.submit(self._fetch_range, url, *next_range)
+                        )
+                    yield data
+            finally:
+                # Closed early: don't start ranges nobody will read
+                for future in in_flight:
+                    future.cancel()
+
+    def _probe_ranges(self, url: str) -> tuple[str, int] | None:
+        """Return ``(final_url, size)`` if ranged download is worthwhile, else None.
+
+        A one-byte range request both reveals the total size and proves the
+        server answers ``Range`` with 206 rather than the full body.
+        """
+        # On the range pool, so its connection is reused by the first range
+        with self._range_client.stream(
+            "GET",
+            url,
+            headers={"Range": "bytes=0-0", "Accept-Encoding": "identity"},
+            timeout=30,
+        ) as resp:
+            resp.raise_for_status()
+            content_range = resp.headers.get("Content-Range", "")
+            if resp.status_code != 206 or "/" not in content_range:
+                return None
+            total = content_range.rsplit("/", 1)[1]
+            if not total.isdigit() or int(total) <= self.RANGE_SIZE:
+                return None
+            # Skip the podcast host's redirect hop on every range request
+            return str(resp.url), int(total)
+
+    def _stream_range(self, url: str, start: int, end: int) -> Iterator[bytes]:
+        """Yield the inclusive byte range ``start``–``end`` of ``url`` in chunks."""
+        received = 0
+        with self._range_client.stream(
+            "GET",
+            url,
+            headers={"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"},
+        ) as resp:
+            resp.raise_for_status()
+            if resp.status_code != 206:
+                raise RuntimeError(f"Server ignored range request for {url}")
+            for chunk in resp.iter_bytes(chunk_size=self.CHUNK_SIZE):
+                received += len(chunk)
+                yield chunk
+        if received != end - start + 1:
+            raise RuntimeError(
+                f"Short range response for {url}: "
+                f"got {received} of {end - start + 1} bytes"
+            )
+
+    def _fetch_range(self, url: str, start: int, end: int) -> bytes:
+        return b"".join(self._stream_range(url, start, end))
+
+
+def _byte_ranges(size: int, part: int) -> list[tuple[int, int]]:
+    """Split ``size`` bytes into inclusive ``(start, end)`` ranges of ``part`` bytes."""
+    return [(start, min(start + part, size) - 1) for start in range(0, size, part)]
+
+
+class _ByteCounter:
+    """Pass-through chunk iterator that tallies bytes for the download log line."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self.total = 0
+
+    def __iter__(self) -> "_ByteCounter":
+        return self
+
+    def __next__(self) -> bytes:
+        chunk = next(self._chunks)
+        self.total += len(chunk)
+        return chunk
+
+    def close(self) -> None:
+        close = getattr(self._chunks, "close", None)
+        if close is not None:
+            close()
 
 
 # ====================================================================
@@ -213,30 +781,53 @@ class HTTPDownloader(Downloader):
 
 
 class EpisodeProcessor:
-    """Coordinates download → transcribe → store."""
+    """Coordinates download → transcribe → store.
+
+    With an ``upload_executor`` the store step runs in the background and
+    ``process`` returns as soon as the upload is queued; call
+    ``drain_uploads`` before exiting so queued writes aren't lost.
+    """
 
     def __init__(
         self,
         transcriber: Transcriber,
         storage: Storage,
         downloader: Downloader,
+        upload_executor: Executor | None = None,
     ):
         self.transcriber = transcriber
         self.storage = storage
         self.downloader = downloader
+        self._upload_executor = upload_executor
+        self._uploads: dict[str, Future] = {}
+        self._uploads_lock = threading.Lock()
 
     def process(self, episode: PodcastEpisode, trace_id: str = "") -> str:
         log_ctx = {"trace_id": trace_id, "episode_guid": episode.guid}
-        with tempfile.TemporaryDirectory() as tmpdir:
-            mp3_path = os.path.join(tmpdir, "episode.mp3")
 
+        # Cloud Tasks retries redeliver episodes that already finished; don't
+        # pay for the download and GPU time twice
+        existing = self.storage.transcription_path(episode)
+        with self._uploads_lock:
+            uploading = existing in self._uploads
+        if uploading or self.storage.exists(existing):
+            log(f"Already transcribed: {existing}", output_path=existing, **log_ctx)
+            return existing
+
+        with tempfile.TemporaryDirectory(dir=STAGING_DIR) as tmpdir:
             log(f"Downloading: {episode.mp3_url}", **log_ctx)
-            self.downloader.download(episode.mp3_url, mp3_path)
-            size_mb = os.path.getsize(mp3_path) / (1024 * 1024)
+            # The transcriber consumes the download as it streams in, so for
+            # Whisper the MP3 is decoded while it is still arriving
+            chunks = _ByteCounter(self.downloader.iter_download(episode.mp3_url))
+            audio = self.transcriber.load_audio(chunks, tmpdir)
+            size_mb = chunks.total / (1024 * 1024)
             log(f"Downloaded ({size_mb:.1f} MB)", size_mb=round(size_mb, 1), **log_ctx)
 
             log("Transcribing…", **log_ctx)
-            result = self.transcriber.transcribe(mp3_path)
+            result = self.transcriber.transcribe(audio)
+            # ~230 MB of PCM per hour of audio; don't hold it through the
+            # upload while other requests are decoding theirs
+            del audio
             log(
                 f"Done: {result.duration:.1f}s of audio",
                 duration=result.duration,
@@ -244,6 +835,44 @@ class EpisodeProcessor:
                 **log_ctx,
             )
 
-        path = self.storage.upload_transcription(episode, result)
-        log(f"Stored transcription: {path}", output_path=path, **log_ctx)
+        if self._upload_executor is None:
+            path = self.storage.upload_transcription(episode, result)
+            log(f"Stored transcription: {path}", output_path=path, **log_ctx)
+            return path
+
+        path = self.storage.transcription_path(episode)
+        with self._uploads_lock:
+            future = self._upload_executor.submit(
+                self.storage.upload_transcription, episode, result
+            )
+            self._uploads[path] = future
+        future.add_done_callback(lambda f: self._upload_finished(path, f, log_ctx))
+        log(f"Queued transcription upload: {path}", output_path=path, **log_ctx)
         return path
+
+    def drain_uploads(self) -> None:
+        """Block until every queued background upload has finished."""
+        with self._uploads_lock:
+            pending = list(self._uploads.values())
+        if pending:
+            log(f"Waiting for {len(pending)} transcription upload(s)")
+            wait(pending)
+
+    def _upload_finished(self, path: str, future: Future, log_ctx: dict) -> None:
+        with self._uploads_lock:
+            # An overlapping delivery of the same guid may have replaced this
+            # entry with its own upload; leave that one tracked
+            if self._uploads.get(path) is future:
+                del self._uploads[path]
+        error = future.exception()
+        if error is not None:
+            # The task was already acknowledged and GCS retries are exhausted,
+            # so nothing will retry this
+            log(
+                f"Error uploading {path}: {error}",
+                severity="ERROR",
+                output_path=path,
+                **log_ctx,
+            )
+        else:
+            log(f"Stored transcription: {path}", output_path=path, **log_ctx)
@@ -1,13 +1,17 @@
 """Flask HTTP server — thin wrapper around EpisodeProcessor."""
 
+import atexit
 import os
+from concurrent.futures import ThreadPoolExecutor
 
+import msgspec
 from flask import Flask, request, Response
 
 from core import (
     EpisodeProcessor,
     PodcastEpisode,
     WhisperTranscriber,
+    TransformersWhisperTranscriber,
     FakeTranscriber,
     GCSStorage,
     LocalStorage,
@@ -17,42 +21,71 @@ from core import (
 
 app = Flask(__name__)
 
+
+class EpisodeTask(PodcastEpisode):
+    """Cloud Tasks payload: the episode plus the dispatcher's correlation ID."""
+
+    trace_id: str = ""
+
+
 # ----------------------------------------------------------------
 # Build the processor based on environment
 # ----------------------------------------------------------------
 USE_FAKE = os.getenv("FAKE_MODE", "").lower() in ("1", "true", "yes")
+# "transformers" (batched HF pipeline, model from WHISPER_MODEL_ID) or
+# "faster-whisper" (CTranslate2, model from WHISPER_MODEL_SIZE)
+WHISPER_BACKEND = os.getenv("WHISPER_BACKEND", "transformers")
 
 if USE_FAKE:
     log("*** FAKE MODE — no GPU, no GCS, instant results ***")
     transcriber = FakeTranscriber()
     storage = LocalStorage(output_dir=os.getenv("OUTPUT_DIR", "output"))
 else:
-    transcriber = WhisperTranscriber(
-        model_size=os.getenv("WHISPER_MODEL_SIZE", "large-v3"),
-        device=os.getenv("WHISPER_DEVICE", "cuda"),
-        compute_type=os.getenv("WHISPER_COMPUTE_TYPE", "float16"),
-    )
+    if WHISPER_BACKEND == "faster-whisper":
+        transcriber = WhisperTranscriber(
+            model_size=os.getenv("WHISPER_MODEL_SIZE", "large-v3-turbo"),
+            device=os.getenv("WHISPER_DEVICE", "cuda"),
+            compute_type=os.getenv("WHISPER_COMPUTE_TYPE", "int8_float16"),
+            num_workers=int(os.getenv("WHISPER_NUM_WORKERS", "1")),
+            batch_size=int(os.getenv("WHISPER_BATCH_SIZE", "16")),
+        )
+    else:
+        transcriber = TransformersWhisperTranscriber(
+            model_id=os.getenv("WHISPER_MODEL_ID", "openai/whisper-large-v3-turbo"),
+            device=os.getenv("WHISPER_DEVICE", "cuda"),
+            batch_size=int(os.getenv("WHISPER_BATCH_SIZE", "24")),
+        )
     storage = GCSStorage(
         bucket_name=os.getenv("GCS_BUCKET", "sverige-radio-transcription")
     )
 
+# Uploads finish after the response so Cloud Tasks isn't kept waiting on GCS.
+# gunicorn turns SIGTERM on scale-in into a graceful worker exit, which runs
+# atexit hooks, so queued writes are drained there. This is best-effort only:
+# Cloud Run sends SIGKILL 10 s after SIGTERM, well inside gunicorn's 30 s
+# graceful timeout, so an upload still running at that point is lost.
+_upload_pool = ThreadPoolExecutor(max_workers=4)
+
 processor = EpisodeProcessor(
     transcriber=transcriber,
     storage=storage,
     downloader=HTTPDownloader(),
+    upload_executor=_upload_pool,
 )
+atexit.register(processor.drain_uploads)
 
 
 @app.route("/", methods=["POST"])
 def process_episode():
-    episode_data = request.get_json(silent=True)
-    if not episode_data:
+    # Parses the JSON body and builds the struct in a single pass
+    try:
+        episode = msgspec.json.decode(request.get_data(), type=EpisodeTask)
+    except msgspec.ValidationError as e:
+        return Response(f"Invalid episode data: {e}", status=400)
+    except msgspec.DecodeError:
         return Response("No episode data provided", status=400)
 
-    # Extract trace_id before building the episode (it's not a PodcastEpisode field)
-    trace_id = episode_data.pop("trace_id", "")
-
-    episode = PodcastEpisode(**episode_data)
+    trace_id = episode.trace_id
     log(
         f"Processing episode: {episode.title}",
         trace_id=trace_id,
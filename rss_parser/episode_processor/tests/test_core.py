@@ -2,21 +2,34 @@
 
 import json
 import os
+import sys
 import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
+import httpx
+
+import core
 from core import (
     EpisodeProcessor,
     PodcastEpisode,
     FakeTranscriber,
     LocalStorage,
     Downloader,
+    HTTPDownloader,
     TranscriptionResult,
+    _byte_ranges,
+    decode_audio_stream,
 )
 
 
 # A test downloader that writes a small dummy file instead of hitting the network
 class StubDownloader(Downloader):
+    def __init__(self):
+        self.calls = 0
+
     def download(self, url: str, dest_path: str) -> None:
+        self.calls += 1
         with open(dest_path, "wb") as f:
             f.write(b"\x00" * 1024)  # 1KB dummy file
 
@@ -76,6 +89,56 @@ class TestEpisodeProcessor:
 
             assert path1 == path2
 
+    def test_process_skips_already_transcribed_episode(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            downloader = StubDownloader()
+            processor = EpisodeProcessor(
+                transcriber=FakeTranscriber(),
+                storage=LocalStorage(output_dir=tmpdir),
+                downloader=downloader,
+            )
+
+            path1 = processor.process(make_episode(guid="retried"))
+            path2 = processor.process(make_episode(guid="retried"))
+
+            assert path1 == path2
+            assert downloader.calls == 1
+
+    def test_process_with_background_upload(self):
+        with tempfile.TemporaryDirectory() as tmpdir, ThreadPoolExecutor() as pool:
+            processor = EpisodeProcessor(
+                transcriber=FakeTranscriber(),
+                storage=LocalStorage(output_dir=tmpdir),
+                downloader=StubDownloader(),
+                upload_executor=pool,
+            )
+
+            path = processor.process(make_episode())
+            processor.drain_uploads()
+
+            assert os.path.exists(path)
+            with open(path) as f:
+                data = json.load(f)
+            assert data["episode"]["title"] == "Test Episode"
+
+    def test_finished_upload_keeps_newer_upload_for_same_path(self):
+        with tempfile.TemporaryDirectory() as tmpdir, ThreadPoolExecutor() as pool:
+            processor = EpisodeProcessor(
+                transcriber=FakeTranscriber(),
+                storage=LocalStorage(output_dir=tmpdir),
+                downloader=StubDownloader(),
+                upload_executor=pool,
+            )
+            # Two overlapping deliveries of one guid: the second upload
+            # replaced the first in the in-flight map before it finished
+            first, second = Future(), Future()
+            processor._uploads["path"] = second
+            first.set_result("path")
+
+            processor._upload_finished("path", first, {})
+
+            assert processor._uploads["path"] is second
+
 
 class TestFakeTranscriber:
     def test_returns_transcription_result(self):
@@ -88,3 +151,87 @@ class TestFakeTranscriber:
         assert isinstance(result, TranscriptionResult)
         assert result.language == "sv"
         assert len(result.segments) > 0
+
+
+class TestDecodeAudioStream:
+    def test_noisy_decoder_that_exits_early(self, monkeypatch):
+        # Stands in for ffmpeg: floods stderr well past a pipe buffer, emits
+        # two samples and exits without reading its input
+        script = (
+            "import sys; sys.stderr.write('x' * 1_000_000); "
+            "sys.stdout.buffer.write(bytes(8))"
+        )
+        monkeypatch.setattr(
+            core,
+            "_ffmpeg_decode_command",
+            lambda source: [sys.executable, "-c", script],
+        )
+        closed = []
+
+        def chunks():
+            try:
+                while True:
+                    yield bytes(64 * 1024)
+            finally:
+                closed.append(True)
+
+        audio = decode_audio_stream(chunks())
+
+        assert len(audio) == 2
+        assert closed
+
+
+# Serves ``data`` with Range support; the first range is answered slowly so
+# later ranges complete before it
+def range_transport(data: bytes, ranges: bool = True) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        header = request.headers.get("Range")
+        if not ranges or header is None:
+            return httpx.Response(200, content=data)
+        start, end = map(int, header.removeprefix("bytes=").split("-"))
+        end = min(end, len(data) - 1)
+        if start == 0 and end > 0:
+            time.sleep(0.05)
+        return httpx.Response(
+            206,
+            content=data[start : end + 1],
+            headers={"Content-Range": f"bytes {start}-{end}/{len(data)}"},
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def make_downloader(data: bytes, ranges: bool = True) -> HTTPDownloader:
+    downloader = HTTPDownloader(transport=range_transport(data, ranges))
+    downloader.RANGE_SIZE = 1000
+    downloader.CHUNK_SIZE = 64
+    return downloader
+
+
+class TestHTTPDownloader:
+    DATA = os.urandom(4500)
+
+    def test_byte_ranges_cover_size_inclusively(self):
+        assert _byte_ranges(10, 4) == [(0, 3), (4, 7), (8, 9)]
+        assert _byte_ranges(8, 4) == [(0, 3), (4, 7)]
+        assert _byte_ranges(0, 4) == []
+
+    def test_iter_download_yields_ranges_in_order(self):
+        downloader = make_downloader(self.DATA)
+        chunks = downloader.iter_download("https://example.com/a.mp3")
+
+        assert b"".join(chunks) == self.DATA
+
+    def test_download_writes_every_range(self):
+        downloader = make_downloader(self.DATA)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "a.mp3")
+            downloader.download("https://example.com/a.mp3", path)
+            with open(path, "rb") as f:
+                assert f.read() == self.DATA
+
+    def test_server_without_range_support_gets_plain_get(self):
+        downloader = make_downloader(self.DATA, ranges=False)
+        chunks = downloader.iter_download("https://example.com/a.mp3")
+
+        assert b"".join(chunks) == self.DATA
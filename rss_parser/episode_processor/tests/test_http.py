@@ -35,6 +35,16 @@ class TestHTTPEndpoint:
         resp = self.client.post("/", content_type="application/json")
         assert resp.status_code == 400
 
+    def test_invalid_episode_returns_400(self):
+        payload = make_episode_payload()
+        del payload["mp3_url"]
+        resp = self.client.post(
+            "/",
+            data=json.dumps(payload),
+            content_type="application/json",
+        )
+        assert resp.status_code == 400
+
     def test_valid_episode_returns_200(self):
         resp = self.client.post(
             "/",
@@ -1,13 +1,24 @@
+import functools
+import hashlib
 import json
 import os
 import sys
 import uuid
-from dataclasses import dataclass, asdict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from operator import itemgetter
 
 import feedparser
 import flask
 import functions_framework
+import msgspec
+import requests
+from google.api_core.exceptions import NotFound
 from google.cloud import storage, tasks_v2
+from google.cloud.storage.retry import DEFAULT_RETRY
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 def log(message: str, severity: str = "INFO", **kwargs):
@@ -20,8 +31,41 @@ RSS_FEEDS = [
     "https://sr-restored.se/rss/5466"  # Dick Harrison svarar
 ]
 
-
-@dataclass
+# Per-feed HTTP validators and body hash, so unchanged feeds come back as a 304
+# and are rebuilt from feeds.json instead of being parsed again
+FEED_CACHE_BLOB = "feed_cache.json"
+
+# Shared across feeds (and warm invocations) so connections and TLS sessions
+# are reused instead of re-handshaking per feed
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        # Transient failures retry on the pooled connection instead of
+        # dropping the feed for this run
+        max_retries=Retry(
+            total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)
+        ),
+    ),
+)
+# Fail fast on an unreachable host; the read timeout applies between bytes
+FEED_TIMEOUT = (3, 10)
+
+# Whole-object overwrites are idempotent, so transient GCS errors are safe to
+# retry. upload_from_string only retries uploads with generation preconditions
+# unless given a policy; blob.open's writer already retries with DEFAULT_RETRY,
+# and gets this one too so both uploads back off the same way.
+GCS_UPLOAD_RETRY = DEFAULT_RETRY.with_delay(initial=1.0, maximum=8.0)
+
+# Resumable upload chunk for feeds.json (must be a multiple of 256 KiB). The
+# writer buffers this much before each request, so it bounds upload memory;
+# the 40 MiB default would hold the whole document.
+FEEDS_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(slots=True)
 class PodcastEpisode:
     """Represents a single podcast episode extracted from RSS."""
 
@@ -31,101 +75,309 @@ class PodcastEpisode:
     pub_date: str
     mp3_url: str
 
+    def to_dict(self) -> dict:
+        # Cheaper than dataclasses.asdict, which deep-copies every field
+        return {
+            "title": self.title,
+            "description": self.description,
+            "guid": self.guid,
+            "pub_date": self.pub_date,
+            "mp3_url": self.mp3_url,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class Feed:
+    feed_url: str
     title: str
     podcast_episodes: list[PodcastEpisode]
 
 
-def parse_rss_feed(feed_url: str) -> Feed:
+@dataclass(slots=True)
+class StoredEpisode:
+    """The only episode field read back from the previous feeds.json."""
+
+    guid: str
+
+
+@dataclass(slots=True)
+class StoredFeed:
+    # Missing from feeds.json written before feeds recorded their URL
+    feed_url: str = ""
+    podcast_episodes: list[StoredEpisode] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class CachedFeed:
+    """HTTP validators and body hash from one feed URL's last full fetch."""
+
+    etag: str | None
+    last_modified: str | None
+    body_hash: str
+
+
+_ENTRY_KEYS = ("title", "description", "guid", "published")
+_entry_fields = itemgetter(*_ENTRY_KEYS)
+
+
+def _episode_from_entry(entry) -> PodcastEpisode:
+    """Map a feedparser entry to a PodcastEpisode, defaulting missing fields to ''."""
+    try:
+        # Each key still goes through FeedParserDict.__getitem__ (keymap
+        # aliasing included); this only skips the per-field .get dispatch and
+        # default handling. An entry missing any field repeats all four lookups
+        # below, which is rare for complete feeds
+        title, description, guid, pub_date = _entry_fields(entry)
+    except KeyError:
+        title, description, guid, pub_date = (entry.get(k, "") for k in _ENTRY_KEYS)
+    # An entry without enclosures has an empty list, not a missing key
+    enclosures = entry.get("enclosures") or ({},)
+    return PodcastEpisode(
+        title=title,
+        description=description,
+        guid=guid,
+        pub_date=pub_date,
+        mp3_url=enclosures[0].get("url", ""),
+    )
+
+
+def parse_rss_feed(
+    feed_url: str,
+    feed_cache: dict[str, CachedFeed] | None = None,
+    previous_feeds: dict[str, msgspec.Raw] | None = None,
+) -> Feed:
     """
     Parse an RSS feed and extract all episodes with their MP3 URLs.
 
     Args:
         feed_url: URL of the RSS feed to parse
+        feed_cache: Cache from fetch_feed_cache(). Used for conditional
+            requests and updated in place with this feed's latest validators.
+        previous_feeds: From index_feeds_by_url(); an unchanged feed is
+            rebuilt from its copy here instead of being parsed.
 
     Returns:
         List of PodcastEpisode objects
     """
-    feed = feedparser.parse(feed_url)
-    episodes = []
+    previous = (previous_feeds or {}).get(feed_url)
+    # Validators are only worth sending when there is a copy to rebuild from
+    cached = (feed_cache or {}).get(feed_url) if previous is not None else None
+    headers = {}
+    if cached and cached.etag:
+        headers["If-None-Match"] = cached.etag
+    if cached and cached.last_modified:
+        headers["If-Modified-Since"] = cached.last_modified
+
+    resp = SESSION.get(feed_url, headers=headers, timeout=FEED_TIMEOUT)
+    if resp.status_code == 304 and cached:
+        log(f"Feed not modified: {feed_url}", feed_url=feed_url)
+        return msgspec.json.decode(previous, type=Feed)
+    resp.raise_for_status()
+
+    # Some hosts send no validators; an identical body still needs no parse
+    body_hash = hashlib.blake2b(resp.content, digest_size=16).hexdigest()
+    if cached and cached.body_hash == body_hash:
+        log(f"Feed unchanged: {feed_url}", feed_url=feed_url)
+        return msgspec.json.decode(previous, type=Feed)
+
+    feed = feedparser.parse(
+        resp.content,
+        # Keep the URL and charset feedparser would have seen fetching itself
+        response_headers={
+            "content-location": resp.url,
+            "content-type": resp.headers.get("Content-Type", ""),
+        },
+        # Descriptions are stored verbatim, so keep their raw HTML and skip
+        # feedparser's per-entry sanitizing and link rewriting. GUIDs and
+        # enclosure URLs are still resolved as before.
+        sanitize_html=False,
+        resolve_relative_uris=False,
+    )
 
     feed_title = feed.feed.get("title", "")  # type: ignore
-    for entry in feed.entries:
-        episode = PodcastEpisode(
-            title=entry.get("title", ""),  # type: ignore
-            description=entry.get("description", ""),  # type: ignore
-            guid=entry.get("guid", ""),  # type: ignore
-            pub_date=entry.get("published", ""),  # type: ignore
-            mp3_url=entry.get("enclosures", [{}])[0].get("url", ""),  # type: ignore
+    episodes = [_episode_from_entry(entry) for entry in feed.entries]
+
+    if feed_cache is not None:
+        feed_cache[feed_url] = CachedFeed(
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+            body_hash=body_hash,
         )
-        episodes.append(episode)
+    return Feed(feed_url=feed_url, title=feed_title, podcast_episodes=episodes)
+
+
+@functools.cache
+def _gcs_client() -> storage.Client:
+    """One client per process: credential lookup and its HTTP session are reused."""
+    return storage.Client()
+
+
+def fetch_feed_cache() -> dict[str, CachedFeed]:
+    """Fetch the per-feed HTTP cache from GCS."""
+    client = _gcs_client()
+    bucket = client.bucket("sverige-radio-transcription")
+    blob = bucket.blob(FEED_CACHE_BLOB)
+    try:
+        return msgspec.json.decode(blob.download_as_bytes(), type=dict[str, CachedFeed])
+    except NotFound:
+        log("No feed cache found in GCS.")
+        return {}
 
-    return Feed(title=feed_title, podcast_episodes=episodes)
 
+def upload_feed_cache(feed_cache: dict[str, CachedFeed]):
+    """Store the per-feed HTTP cache in GCS for the next run."""
+    client = _gcs_client()
+    bucket = client.bucket("sverige-radio-transcription")
+    data = msgspec.json.encode(feed_cache)
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    if _stored_hash(bucket, FEED_CACHE_BLOB) == digest:
+        return
+    blob = bucket.blob(FEED_CACHE_BLOB)
+    blob.metadata = {"content_hash": digest}
+    blob.upload_from_string(
+        data, content_type="application/json", retry=GCS_UPLOAD_RETRY
+    )
 
-def fetch_and_process_feeds():
-    """Fetch all RSS feeds and process their episodes."""
+
+def fetch_and_process_feeds(
+    feed_cache: dict[str, CachedFeed] | None = None,
+    previous_feeds: dict[str, msgspec.Raw] | None = None,
+):
+    """Fetch all RSS feeds concurrently and process their episodes."""
 
     feeds: list[Feed] = []
 
-    for feed_url in RSS_FEEDS:
-        log(f"Fetching feed: {feed_url}", feed_url=feed_url)
-        feed = parse_rss_feed(feed_url)
+    # Fetching is network-bound, so feeds download in parallel; at least one
+    # worker, since ThreadPoolExecutor rejects max_workers=0 for an empty list
+    with ThreadPoolExecutor(max_workers=max(1, min(len(RSS_FEEDS), 8))) as executor:
+        futures = {}
+        for feed_url in RSS_FEEDS:
+            log(f"Fetching feed: {feed_url}", feed_url=feed_url)
+            futures[feed_url] = executor.submit(
+                parse_rss_feed, feed_url, feed_cache, previous_feeds
+            )
+
+        # Collect in RSS_FEEDS order so feeds.json stays stable between runs
+        for feed_url, future in futures.items():
+            try:
+                feed = future.result()
+            except Exception as e:
+                log(
+                    f"Error fetching feed {feed_url}: {e}",
+                    severity="ERROR",
+                    feed_url=feed_url,
+                )
+                # Fall back to the last good copy so the feed doesn't vanish
+                # from feeds.json and get all its episodes re-dispatched
+                previous = (previous_feeds or {}).get(feed_url)
+                if previous is None:
+                    continue
+                feed = msgspec.json.decode(previous, type=Feed)
 
-        feeds.extend([feed])
+            feeds.append(feed)
 
     return feeds
 
 
+def _stored_hash(bucket: storage.Bucket, blob_name: str) -> str | None:
+    """Content hash recorded on an existing blob, if any."""
+    blob = bucket.get_blob(blob_name)
+    return (blob.metadata or {}).get("content_hash") if blob else None
+
+
+def _iter_feeds_json(feeds: list[Feed]) -> Iterator[bytes]:
+    """
+    Yield the indented JSON array of feeds, one feed at a time.
+
+    Raw newlines can't occur inside JSON strings, so re-indenting each feed's
+    lines reproduces the layout of formatting the whole list.
+    """
+    yield b"["
+    for i, feed in enumerate(feeds):
+        feed_json = msgspec.json.format(msgspec.json.encode(feed), indent=2)
+        yield b",\n  " if i else b"\n  "
+        yield feed_json.replace(b"\n", b"\n  ")
+    yield b"\n]" if feeds else b"]"
+
+
 def upload_to_gcs(feeds: list[Feed], bucket_name: str, blob_name: str):
     """
     Upload feeds as JSON to Google Cloud Storage.
 
+    Skipped when the blob already holds the same content.
+
     Args:
         feeds: List of Feed objects to upload
         bucket_name: Name of the GCS bucket
         blob_name: Name of the blob (e.g., 'feeds.json')
     """
-    client = storage.Client()
+    client = _gcs_client()
     bucket = client.bucket(bucket_name)
-    blob = bucket.blob(blob_name)
 
-    # Convert feeds to JSON
-    feeds_data = [asdict(feed) for feed in feeds]
-    json_data = json.dumps(feeds_data, indent=2, ensure_ascii=False)
+    # Hash in a first pass so the upload itself can still stream
+    hasher = hashlib.blake2b(digest_size=16)
+    for chunk in _iter_feeds_json(feeds):
+        hasher.update(chunk)
+    digest = hasher.hexdigest()
+    if _stored_hash(bucket, blob_name) == digest:
+        log(f"{blob_name} unchanged, skipping upload", blob_name=blob_name)
+        return
 
-    # Upload the JSON blob
-    blob.upload_from_string(json_data, content_type="application/json")
+    blob = bucket.blob(blob_name)
+    blob.metadata = {"content_hash": digest}
+    # Encoded one feed at a time and sent in FEEDS_UPLOAD_CHUNK_SIZE pieces,
+    # so memory is about one chunk plus one feed, not the whole document
+    with blob.open(
+        "wb",
+        chunk_size=FEEDS_UPLOAD_CHUNK_SIZE,
+        content_type="application/json",
+        retry=GCS_UPLOAD_RETRY,
+    ) as fp:
+        for chunk in _iter_feeds_json(feeds):
+            fp.write(chunk)
     log(f"Uploaded {blob_name} to bucket {bucket_name}", blob_name=blob_name)
 
 
-def fetch_existing_feeds() -> list[dict]:
-    """Fetch existing feeds from GCS bucket."""
-    client = storage.Client()
+def fetch_existing_feeds() -> list[msgspec.Raw]:
+    """Fetch existing feeds from GCS bucket, each as its undecoded JSON."""
+    client = _gcs_client()
     bucket = client.bucket("sverige-radio-transcription")
     blob = bucket.blob("feeds.json")
-    if not blob.exists():
+    # Download directly rather than probing with exists() first; a missing
+    # blob costs the same single round trip
+    try:
+        data = blob.download_as_bytes()
+    except NotFound:
         log("No existing feeds found in GCS.")
         return []
-    data = blob.download_as_text()
-    feeds_json = json.loads(data)
-    return feeds_json
+    # Only splits the array; each feed is decoded later into just the fields
+    # its caller needs
+    return msgspec.json.decode(data, type=list[msgspec.Raw])
 
 
-def get_existing_episode_guids(existing_feeds: list[dict]) -> set[str]:
+def index_feeds_by_url(existing_feeds: list[msgspec.Raw]) -> dict[str, msgspec.Raw]:
+    """Map each stored feed's URL to its JSON, for rebuilding unchanged feeds."""
+    index = {}
+    for raw in existing_feeds:
+        feed_url = msgspec.json.decode(raw, type=StoredFeed).feed_url
+        if feed_url:
+            index[feed_url] = raw
+    return index
+
+
+def get_existing_episode_guids(existing_feeds: list[msgspec.Raw]) -> set[str]:
     """Extract all episode GUIDs from existing feeds."""
     guids = set()
-    for feed in existing_feeds:
-        if "podcast_episodes" in feed:
-            for episode in feed["podcast_episodes"]:
-                guids.add(episode["guid"])
+    for raw in existing_feeds:
+        # Typed decoding skips every field but the GUIDs, so titles and long
+        # descriptions are never turned into Python objects
+        stored = msgspec.json.decode(raw, type=StoredFeed)
+        guids.update(episode.guid for episode in stored.podcast_episodes)
     return guids
 
 
 def identify_new_episodes(
-    feeds: list[Feed], existing_feeds: list[dict]
+    feeds: list[Feed], existing_feeds: list[msgspec.Raw]
 ) -> list[PodcastEpisode]:
     """Identify episodes that are new (not in existing feeds)."""
     existing_guids = get_existing_episode_guids(existing_feeds)
@@ -139,6 +391,12 @@ def identify_new_episodes(
     return new_episodes
 
 
+@functools.cache
+def _tasks_client() -> tasks_v2.CloudTasksClient:
+    """Shared Cloud Tasks client, so each dispatch doesn't open a new channel."""
+    return tasks_v2.CloudTasksClient()
+
+
 def dispatch_to_cloud_tasks(
     project: str,
     queue: str,
@@ -156,11 +414,11 @@ def dispatch_to_cloud_tasks(
         episode: PodcastEpisode object to process
         trace_id: Correlation ID for tracing the request across services
     """
-    client = tasks_v2.CloudTasksClient()
+    client = _tasks_client()
     parent = client.queue_path(project, location, queue)
 
     # Convert episode to dict for JSON serialization
-    episode_data = asdict(episode)
+    episode_data = episode.to_dict()
     episode_data["trace_id"] = trace_id
 
     url = os.environ["EPISODE_PROCESSOR_URL"]
@@ -170,7 +428,7 @@ def dispatch_to_cloud_tasks(
             "http_method": tasks_v2.HttpMethod.POST,
             "url": url,
             "headers": {"Content-Type": "application/json"},
-            "body": json.dumps(episode_data).encode(),
+            "body": msgspec.json.encode(episode_data),
             "oidc_token": {
                 "service_account_email": os.environ.get(
                     "GOOGLE_CLOUD_SERVICE_ACCOUNT", ""
@@ -191,9 +449,9 @@ def dispatch_to_cloud_tasks(
 def main():
     trace_id = str(uuid.uuid4())
     log("RSS Parser - Fetching feeds and extracting episodes", trace_id=trace_id)
-    feeds = fetch_and_process_feeds()
-
-    existing_feeds: list[dict] = fetch_existing_feeds()
+    feed_cache = fetch_feed_cache()
+    existing_feeds: list[msgspec.Raw] = fetch_existing_feeds()
+    feeds = fetch_and_process_feeds(feed_cache, index_feeds_by_url(existing_feeds))
 
     # Identify new episodes
     new_episodes = identify_new_episodes(feeds, existing_feeds)
@@ -220,10 +478,15 @@ def main():
                     episode_guid=episode.guid,
                 )
 
-    # Upload to Google Cloud Storage
+    # Only after dispatching: if this run dies part-way, the GUIDs it never
+    # dispatched must still be missing from feeds.json so the next run
+    # picks them up
     upload_to_gcs(
         feeds=feeds, bucket_name="sverige-radio-transcription", blob_name="feeds.json"
     )
+    # Last: the cache's validators vouch for the copies in feeds.json, so they
+    # must never be newer than the feeds.json that was actually stored
+    upload_feed_cache(feed_cache)
 
 
 @functions_framework.http
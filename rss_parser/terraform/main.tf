@@ -273,6 +273,9 @@ resource "google_cloud_run_v2_service" "episode_processor" {
           memory           = "16Gi"
           "nvidia.com/gpu" = "1"
         }
+        # Keep CPU allocated between requests: transcription uploads finish
+        # in the background after the response is sent
+        cpu_idle = false
       }
 
       env {
@@ -280,8 +283,12 @@ resource "google_cloud_run_v2_service" "episode_processor" {
         value = var.bucket_name
       }
       env {
-        name  = "WHISPER_MODEL_SIZE"
-        value = "large-v3"
+        name  = "WHISPER_BACKEND"
+        value = "transformers"
+      }
+      env {
+        name  = "WHISPER_MODEL_ID"
+        value = "openai/whisper-large-v3-turbo"
       }
       env {
         name  = "WHISPER_DEVICE"
@@ -289,7 +296,7 @@ resource "google_cloud_run_v2_service" "episode_processor" {
       }
       env {
         name  = "WHISPER_COMPUTE_TYPE"
-        value = "float16"
+        value = "int8_float16"
       }
     }
 
@@ -304,6 +311,9 @@ resource "google_cloud_run_v2_service" "episode_processor" {
       max_instance_count = 3
     }
 
+    # Matches gunicorn's --threads: requests beyond this go to another instance
+    max_instance_request_concurrency = 4
+
     timeout         = "900s"
     service_account = google_service_account.episode_processor.email
   }
@@ -0,0 +1,190 @@
+"""Tests for the RSS parser — run with: pytest tests/"""
+
+import json
+from dataclasses import asdict
+
+import feedparser
+import msgspec
+import pytest
+import requests
+
+import main
+from main import (
+    CachedFeed,
+    Feed,
+    PodcastEpisode,
+    _episode_from_entry,
+    _iter_feeds_json,
+    fetch_and_process_feeds,
+    index_feeds_by_url,
+    parse_rss_feed,
+)
+
+FEED_URL = "https://example.com/rss"
+
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Dick Harrison svarar</title>
+<item>
+  <title>Vikingar</title>
+  <description>Om vikingatiden</description>
+  <guid>https://example.com/ep-1</guid>
+  <pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate>
+  <enclosure url="https://example.com/ep-1.mp3" type="audio/mpeg"/>
+</item>
+</channel></rss>"""
+
+
+class FakeResponse:
+    def __init__(self, status_code: int = 200, content: bytes = b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.url = FEED_URL
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+def make_feed(**overrides) -> Feed:
+    episode = PodcastEpisode(
+        title="Vikingar",
+        description="Om vikingatiden",
+        guid="https://example.com/ep-1",
+        pub_date="Mon, 01 Jan 2024 00:00:00 GMT",
+        mp3_url="https://example.com/ep-1.mp3",
+    )
+    defaults = {
+        "feed_url": FEED_URL,
+        "title": "Dick Harrison svarar",
+        "podcast_episodes": [episode],
+    }
+    defaults.update(overrides)
+    return Feed(**defaults)
+
+
+def stored(feeds: list[Feed]) -> dict[str, msgspec.Raw]:
+    """The previous-feeds index as main() builds it from feeds.json."""
+    data = b"".join(_iter_feeds_json(feeds))
+    return index_feeds_by_url(msgspec.json.decode(data, type=list[msgspec.Raw]))
+
+
+@pytest.fixture
+def responses(monkeypatch):
+    """Queue responses for SESSION.get and record the headers it was sent."""
+    queued, sent = [], []
+
+    def get(url, headers=None, timeout=None):
+        sent.append(headers or {})
+        response = queued.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(main.SESSION, "get", get)
+    return queued, sent
+
+
+def fail_parse(*args, **kwargs):
+    raise AssertionError("feed should not have been parsed")
+
+
+@pytest.fixture
+def no_parsing(monkeypatch):
+    monkeypatch.setattr(feedparser, "parse", fail_parse)
+
+
+class TestParseRssFeed:
+    def test_parses_episodes_and_records_validators(self, responses):
+        queued, _ = responses
+        queued.append(FakeResponse(content=RSS, headers={"ETag": '"v1"'}))
+        cache: dict[str, CachedFeed] = {}
+
+        feed = parse_rss_feed(FEED_URL, cache)
+
+        assert feed == make_feed()
+        assert cache[FEED_URL].etag == '"v1"'
+
+    def test_not_modified_returns_stored_feed(self, responses, no_parsing):
+        queued, sent = responses
+        queued.append(FakeResponse(status_code=304))
+        cache = {FEED_URL: CachedFeed(etag='"v1"', last_modified=None, body_hash="")}
+
+        feed = parse_rss_feed(FEED_URL, cache, stored([make_feed()]))
+
+        assert feed == make_feed()
+        assert sent[0]["If-None-Match"] == '"v1"'
+
+    def test_identical_body_returns_stored_feed(self, responses, monkeypatch):
+        queued, _ = responses
+        queued.append(FakeResponse(content=RSS))
+        cache: dict[str, CachedFeed] = {}
+        parse_rss_feed(FEED_URL, cache)
+
+        queued.append(FakeResponse(content=RSS))
+        monkeypatch.setattr(feedparser, "parse", fail_parse)
+        feed = parse_rss_feed(FEED_URL, cache, stored([make_feed()]))
+
+        assert feed == make_feed()
+
+    def test_no_conditional_request_without_stored_copy(self, responses):
+        queued, sent = responses
+        queued.append(FakeResponse(content=RSS))
+        cache = {FEED_URL: CachedFeed(etag='"v1"', last_modified=None, body_hash="")}
+
+        parse_rss_feed(FEED_URL, cache, previous_feeds={})
+
+        assert "If-None-Match" not in sent[0]
+
+
+class TestFetchAndProcessFeeds:
+    def test_fetch_error_falls_back_to_stored_feed(self, responses, monkeypatch):
+        queued, _ = responses
+        queued.append(requests.ConnectionError("unreachable"))
+        monkeypatch.setattr(main, "RSS_FEEDS", [FEED_URL])
+
+        feeds = fetch_and_process_feeds({}, stored([make_feed()]))
+
+        assert feeds == [make_feed()]
+
+    def test_fetch_error_without_stored_feed_skips_it(self, responses, monkeypatch):
+        queued, _ = responses
+        queued.append(requests.ConnectionError("unreachable"))
+        monkeypatch.setattr(main, "RSS_FEEDS", [FEED_URL])
+
+        assert fetch_and_process_feeds({}, {}) == []
+
+    def test_no_feeds_configured(self, monkeypatch):
+        monkeypatch.setattr(main, "RSS_FEEDS", [])
+
+        assert fetch_and_process_feeds({}, {}) == []
+
+
+class TestEpisodeFromEntry:
+    def test_empty_enclosures_give_empty_mp3_url(self):
+        entry = feedparser.FeedParserDict(title="Utan ljud", enclosures=[])
+
+        episode = _episode_from_entry(entry)
+
+        assert episode.mp3_url == ""
+        assert episode.guid == ""
+
+
+class TestFeedsJson:
+    @pytest.mark.parametrize(
+        "feeds",
+        [
+            [],
+            [make_feed()],
+            [
+                make_feed(title="Vetenskapsradion Historia åäö"),
+                make_feed(podcast_episodes=[]),
+            ],
+        ],
+    )
+    def test_matches_stdlib_indented_json(self, feeds):
+        expected = json.dumps(
+            [asdict(feed) for feed in feeds], indent=2, ensure_ascii=False
+        )
+
+        assert b"".join(_iter_feeds_json(feeds)).decode() == expected